@@ -0,0 +1,638 @@
+"""
+Server asyncio lokal untuk LMISolver
+Menerima request JSON (satu objek per baris) melalui TCP atau Unix socket,
+mengelompokkan request menjadi micro-batch, lalu menjalankan solve_dp di worker pool
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from lmis import LMISolver
+
+# Perkiraan ukuran maksimum satu elemen sequence dalam JSON, termasuk ", "
+BYTES_PER_ELEMENT = 32
+# Ruang tambahan untuk field selain 'sequence' (id, op, timeout)
+REQUEST_OVERHEAD = 4096
+# solve_dp berjalan O(n^2); satu sequence 5000 elemen butuh sekitar 1-2 detik,
+# sehingga batch penuh tetap jauh di bawah timeout default 5 detik
+DEFAULT_MAX_SEQUENCE_LENGTH = 5000
+DEFAULT_MAX_BATCH_COST = DEFAULT_MAX_SEQUENCE_LENGTH ** 2
+
+
+def _solve_batch(sequences):
+    """
+    Menyelesaikan satu batch sequence di dalam worker process
+
+    Args:
+        sequences: List of sequence (list of integers)
+
+    Returns:
+        List of tuple (longest_sequence, length) sesuai urutan input
+    """
+    return [LMISolver(sequence).solve_dp() for sequence in sequences]
+
+
+class LatencyTracker:
+    """Menyimpan latency request terakhir untuk menghitung percentile"""
+
+    def __init__(self, window=10000):
+        self.samples = deque(maxlen=window)
+
+    def record(self, seconds):
+        """Mencatat satu latency (dalam detik)"""
+        self.samples.append(seconds)
+
+    def percentiles(self, points=(50, 90, 99)):
+        """
+        Menghitung percentile latency dengan metode nearest-rank
+
+        Args:
+            points: Percentile yang ingin dihitung
+
+        Returns:
+            Dictionary {'p50': ms, ...}, bernilai None jika belum ada sampel
+        """
+        ordered = sorted(self.samples)
+        result = {}
+        for p in points:
+            if not ordered:
+                result[f'p{p}'] = None
+                continue
+            rank = max(1, math.ceil(p / 100 * len(ordered)))
+            result[f'p{p}'] = round(ordered[rank - 1] * 1000, 3)
+        return result
+
+
+class _PendingRequest:
+    """Request yang sedang menunggu di antrean batch"""
+
+    __slots__ = ('sequence', 'future', 'enqueued_at')
+
+    def __init__(self, sequence, future):
+        self.sequence = sequence
+        self.future = future
+        self.enqueued_at = time.perf_counter()
+
+
+class LMISServer:
+    """
+    Server asyncio yang melayani LMISolver.solve_dp melalui protokol JSON
+
+    Setiap baris request berupa objek JSON:
+        {"id": 1, "sequence": [4, 1, 13], "timeout": 2.0}
+        {"id": 2, "op": "stats"}
+
+    Setiap baris response berupa objek JSON:
+        {"id": 1, "sequence": [1, 13], "length": 2}
+        {"id": 1, "error": "timeout"}
+
+    Timeout hanya mencegah request dikirim ke worker; batch yang sudah
+    berjalan di worker tidak dapat dibatalkan dan tetap menempati worker
+    sampai selesai. Karena itu biaya batch dibatasi dengan len(sequence)^2
+    dan panjang sequence dibatasi agar satu batch selesai jauh sebelum timeout.
+    """
+
+    def __init__(self, workers=None, max_batch_size=32, max_batch_delay=0.005,
+                 max_batch_cost=DEFAULT_MAX_BATCH_COST, max_queue=1024,
+                 default_timeout=5.0, max_sequence_length=DEFAULT_MAX_SEQUENCE_LENGTH):
+        """
+        Inisialisasi server
+
+        Args:
+            workers: Jumlah worker process (None = jumlah CPU)
+            max_batch_size: Jumlah request maksimum dalam satu batch
+            max_batch_delay: Waktu tunggu maksimum (detik) sebelum batch dikirim
+            max_batch_cost: Total biaya maksimum satu batch, dihitung sebagai jumlah
+                len(sequence)^2 (sesuai kompleksitas solve_dp); sequence yang
+                biayanya melebihi batas ini dikirim sebagai batch tunggal
+            max_queue: Kapasitas antrean; request ditolak jika antrean penuh
+            default_timeout: Timeout per-request (detik) jika client tidak memberi nilai
+            max_sequence_length: Panjang sequence maksimum yang diterima
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.max_batch_cost = max_batch_cost
+        self.default_timeout = default_timeout
+        self.max_sequence_length = max_sequence_length
+        # Batas panjang satu baris request, cukup untuk sequence terpanjang
+        self.read_limit = max(2 ** 16,
+                              max_sequence_length * BYTES_PER_ELEMENT + REQUEST_OVERHEAD)
+
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        # Request di antrean yang belum timeout dan belum dikirim ke worker
+        self._waiting = set()
+        self.latency = LatencyTracker()
+        self.executor = None
+        self.server = None
+        self._batch_slots = asyncio.Semaphore(self.workers)
+        self._batcher_task = None
+        self._batch_tasks = set()
+        self._client_tasks = set()
+        self._closing = asyncio.Event()
+        self._carry = None
+        self._inflight_batches = 0
+        self._started_at = None
+        self.counters = {
+            'requests': 0,
+            'completed': 0,
+            'rejected': 0,
+            'timeouts': 0,
+            'errors': 0,
+            'batches': 0,
+            'worker_restarts': 0,
+        }
+
+    async def start(self, host='127.0.0.1', port=8765, unix_path=None):
+        """
+        Membuka listener socket, lalu menjalankan worker pool dan batcher
+
+        Args:
+            host: Alamat TCP (diabaikan jika unix_path diberikan)
+            port: Port TCP (0 = pilih port kosong secara otomatis)
+            unix_path: Path Unix socket (opsional)
+
+        Raises:
+            OSError: Jika socket gagal dibuka (misalnya address already in use)
+        """
+        # Bind dulu agar worker pool tidak dibuat jika socket gagal dibuka
+        if unix_path:
+            self.server = await asyncio.start_unix_server(
+                self._handle_client, path=unix_path, limit=self.read_limit)
+        else:
+            self.server = await asyncio.start_server(
+                self._handle_client, host, port, limit=self.read_limit)
+
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._batcher_task = asyncio.create_task(self._batch_loop())
+        self._started_at = time.perf_counter()
+
+    async def serve_forever(self):
+        """Melayani koneksi sampai task dibatalkan atau close() dipanggil"""
+        # Server.serve_forever() milik asyncio menunggu wait_closed() saat dibatalkan;
+        # sejak Python 3.12.1 itu menunggu semua koneksi client, jadi urutan
+        # penutupan diserahkan ke close()
+        await self._closing.wait()
+
+    async def close(self):
+        """Menghentikan listener, koneksi client, batcher, dan worker pool"""
+        self._closing.set()
+        if self.server is not None:
+            self.server.close()
+
+        # Koneksi yang masih terbuka harus ditutup sebelum wait_closed()
+        for task in self._client_tasks:
+            task.cancel()
+        await asyncio.gather(*self._client_tasks, return_exceptions=True)
+
+        if self.server is not None:
+            await self.server.wait_closed()
+
+        tasks = list(self._batch_tasks)
+        if self._batcher_task is not None:
+            tasks.append(self._batcher_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_statistics(self):
+        """
+        Mendapatkan statistik server
+
+        Returns:
+            Dictionary berisi counter, queue depth, dan latency percentile (ms)
+        """
+        uptime = time.perf_counter() - self._started_at if self._started_at else 0.0
+        stats = dict(self.counters)
+        stats.update({
+            'queue_depth': len(self._waiting),
+            'inflight_batches': self._inflight_batches,
+            'workers': self.workers,
+            'uptime': round(uptime, 3),
+            'latency_ms': self.latency.percentiles(),
+        })
+        return stats
+
+    async def solve(self, sequence, timeout=None):
+        """
+        Memasukkan satu sequence ke antrean batch dan menunggu hasilnya
+
+        Timeout hanya mencegah request dikirim ke worker; jika batch-nya
+        sudah berjalan, worker tetap menyelesaikannya.
+
+        Args:
+            sequence: List of integers
+            timeout: Timeout (detik) untuk request ini
+
+        Returns:
+            Tuple (longest_sequence, length)
+
+        Raises:
+            asyncio.QueueFull: Jika antrean penuh (backpressure)
+            asyncio.TimeoutError: Jika hasil tidak tersedia sebelum timeout
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        future = asyncio.get_running_loop().create_future()
+        pending = _PendingRequest(sequence, future)
+
+        self.counters['requests'] += 1
+        try:
+            self.queue.put_nowait(pending)
+        except asyncio.QueueFull:
+            # Antrean mungkin hanya penuh oleh request yang sudah timeout
+            self._purge_expired()
+            try:
+                self.queue.put_nowait(pending)
+            except asyncio.QueueFull:
+                self.counters['rejected'] += 1
+                raise
+
+        self._waiting.add(pending)
+        future.add_done_callback(lambda _: self._waiting.discard(pending))
+        try:
+            result = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.counters['timeouts'] += 1
+            raise
+
+        self.counters['completed'] += 1
+        self.latency.record(time.perf_counter() - pending.enqueued_at)
+        return result
+
+    def _purge_expired(self):
+        """Membuang request yang sudah timeout dari antrean agar kapasitasnya kembali"""
+        live = []
+        while not self.queue.empty():
+            pending = self.queue.get_nowait()
+            if not pending.future.done():
+                live.append(pending)
+        for pending in live:
+            self.queue.put_nowait(pending)
+
+    async def _next_pending(self, timeout=None):
+        """
+        Mengambil request berikutnya yang belum timeout
+
+        Args:
+            timeout: Waktu tunggu maksimum (detik), None = tanpa batas
+
+        Raises:
+            asyncio.TimeoutError: Jika tidak ada request sebelum timeout
+        """
+        if self._carry is not None:
+            pending, self._carry = self._carry, None
+            if not pending.future.done():
+                return pending
+
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            if deadline is None:
+                pending = await self.queue.get()
+            else:
+                pending = await asyncio.wait_for(
+                    self.queue.get(), max(0.0, deadline - time.perf_counter()))
+            # Request yang sudah timeout tidak perlu dikirim ke worker
+            if not pending.future.done():
+                return pending
+
+    async def _collect_batch(self):
+        """
+        Mengambil request dari antrean sampai batch penuh (jumlah request atau
+        biaya len(sequence)^2) atau deadline tercapai
+
+        Returns:
+            List of _PendingRequest
+        """
+        first = await self._next_pending()
+        batch = [first]
+        cost = len(first.sequence) ** 2
+        deadline = time.perf_counter() + self.max_batch_delay
+
+        # Sequence yang biayanya melebihi max_batch_cost langsung dikirim sendirian
+        while len(batch) < self.max_batch_size and cost < self.max_batch_cost:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                pending = await self._next_pending(remaining)
+            except asyncio.TimeoutError:
+                break
+            if cost + len(pending.sequence) ** 2 > self.max_batch_cost:
+                # Simpan untuk batch berikutnya agar urutan tetap terjaga
+                self._carry = pending
+                break
+            batch.append(pending)
+            cost += len(pending.sequence) ** 2
+
+        batch = [pending for pending in batch if not pending.future.done()]
+        for pending in batch:
+            self._waiting.discard(pending)
+        return batch
+
+    async def _batch_loop(self):
+        """Loop utama batcher: kumpulkan batch lalu kirim ke worker pool"""
+        while True:
+            # Tunggu slot worker kosong agar antrean yang menahan beban (backpressure)
+            await self._batch_slots.acquire()
+            try:
+                batch = await self._collect_batch()
+            except BaseException:
+                self._batch_slots.release()
+                raise
+
+            if not batch:
+                self._batch_slots.release()
+                continue
+
+            self.counters['batches'] += 1
+            self._inflight_batches += 1
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch):
+        """
+        Menjalankan satu batch di worker pool dan mengisi future setiap request
+
+        Args:
+            batch: List of _PendingRequest
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            results = await loop.run_in_executor(
+                executor, _solve_batch, [pending.sequence for pending in batch])
+        except BrokenProcessPool as e:
+            # Worker mati (misalnya OOM kill); hanya batch ini yang digagalkan
+            self._restart_executor(executor)
+            self._fail_batch(batch, e)
+        except Exception as e:
+            self._fail_batch(batch, e)
+        else:
+            for pending, result in zip(batch, results):
+                if not pending.future.done():
+                    pending.future.set_result(result)
+        finally:
+            self._inflight_batches -= 1
+            self._batch_slots.release()
+
+    def _restart_executor(self, broken):
+        """
+        Mengganti worker pool yang rusak dengan yang baru
+
+        Args:
+            broken: Executor yang gagal; diabaikan jika sudah diganti batch lain
+        """
+        if self.executor is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.counters['worker_restarts'] += 1
+
+    def _fail_batch(self, batch, error):
+        """Menggagalkan setiap request dalam batch dengan error yang sama"""
+        self.counters['errors'] += len(batch)
+        for pending in batch:
+            if not pending.future.done():
+                pending.future.set_exception(error)
+
+    def _validate_request(self, sequence, timeout):
+        """
+        Memvalidasi sequence dan timeout dari client
+
+        Returns:
+            Pesan error, atau None jika request valid
+        """
+        if not isinstance(sequence, list):
+            return "'sequence' must be a list of numbers"
+        if len(sequence) > self.max_sequence_length:
+            return f"'sequence' longer than {self.max_sequence_length}"
+        for value in sequence:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return "'sequence' must be a list of numbers"
+            # json.loads menerima NaN/Infinity, tetapi hasilnya bukan JSON yang valid
+            if isinstance(value, float) and not math.isfinite(value):
+                return "'sequence' must contain finite numbers"
+        if timeout is not None and (
+                isinstance(timeout, bool) or not isinstance(timeout, (int, float))
+                or not math.isfinite(timeout) or timeout <= 0):
+            return "'timeout' must be a positive number"
+        return None
+
+    async def _write_response(self, response, writer, write_lock):
+        """
+        Menulis satu response; diabaikan jika client sudah memutus koneksi
+
+        Args:
+            response: Dictionary response
+            writer: StreamWriter milik koneksi
+            write_lock: Lock agar response tidak saling bertumpuk
+        """
+        async with write_lock:
+            try:
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def _handle_request(self, line, writer, write_lock):
+        """
+        Memproses satu baris request dan menulis response-nya
+
+        Args:
+            line: Baris request (bytes)
+            writer: StreamWriter milik koneksi
+            write_lock: Lock agar response tidak saling bertumpuk
+        """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            # json.JSONDecodeError adalah turunan ValueError
+            response = {'id': None, 'error': f"bad request: {e}"}
+        else:
+            response = await self._process_request(request)
+
+        await self._write_response(response, writer, write_lock)
+
+    async def _process_request(self, request):
+        """
+        Menjalankan satu request yang sudah di-parse
+
+        Args:
+            request: Dictionary request dari client
+
+        Returns:
+            Dictionary response
+        """
+        request_id = request.get('id')
+        op = request.get('op', 'solve')
+
+        if op == 'stats':
+            return {'id': request_id, 'stats': self.get_statistics()}
+        if op != 'solve':
+            return {'id': request_id, 'error': f"unknown op: {op}"}
+
+        sequence = request.get('sequence')
+        timeout = request.get('timeout')
+        error = self._validate_request(sequence, timeout)
+        if error is not None:
+            return {'id': request_id, 'error': error}
+
+        try:
+            longest_seq, length = await self.solve(sequence, timeout)
+        except asyncio.QueueFull:
+            return {'id': request_id, 'error': 'overloaded'}
+        except asyncio.TimeoutError:
+            return {'id': request_id, 'error': 'timeout'}
+        except Exception as e:
+            return {'id': request_id, 'error': f"internal error: {e}"}
+        return {'id': request_id, 'sequence': longest_seq, 'length': length}
+
+    async def _read_request(self, reader):
+        """
+        Membaca satu baris request dari client
+
+        Returns:
+            Baris request (bytes), b'' jika koneksi ditutup, atau None jika
+            baris melebihi read_limit (sisa baris tersebut dibuang)
+        """
+        try:
+            return await reader.readuntil(b'\n')
+        except asyncio.IncompleteReadError as e:
+            # Baris terakhir tanpa newline sebelum EOF
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+        # Buang baris yang terlalu besar sampai newline berikutnya
+        while True:
+            await reader.readexactly(consumed)
+            try:
+                await reader.readuntil(b'\n')
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as e:
+                consumed = e.consumed
+
+    async def _handle_client(self, reader, writer):
+        """
+        Melayani satu koneksi client; request dalam satu koneksi boleh pipelined
+        sehingga response dapat kembali tidak berurutan (gunakan 'id')
+        """
+        self._client_tasks.add(asyncio.current_task())
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                line = await self._read_request(reader)
+                if line is None:
+                    await self._write_response(
+                        {'id': None, 'error': 'request too large'}, writer, write_lock)
+                    continue
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._handle_request(line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        except asyncio.CancelledError:
+            # Server sedang dihentikan
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._client_tasks.discard(asyncio.current_task())
+
+
+def parse_args(argv=None):
+    """Parsing argumen command line"""
+    parser = argparse.ArgumentParser(description='Local asyncio LMIS solve server')
+    parser.add_argument('--host', default='127.0.0.1', help='TCP host (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port (default: 8765)')
+    parser.add_argument('--unix', metavar='PATH', help='Listen on a Unix socket instead of TCP')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--max-batch-size', type=int, default=32,
+                        help='Maximum requests per batch (default: 32)')
+    parser.add_argument('--max-batch-delay', type=float, default=0.005,
+                        help='Maximum seconds to wait while filling a batch (default: 0.005)')
+    parser.add_argument('--max-batch-cost', type=int, default=DEFAULT_MAX_BATCH_COST,
+                        help='Maximum batch cost as the sum of len(sequence)**2, since '
+                             'solve_dp is O(n^2); costlier sequences run as a batch of one '
+                             f'(default: {DEFAULT_MAX_BATCH_COST})')
+    parser.add_argument('--max-queue', type=int, default=1024,
+                        help='Queue capacity before requests are rejected (default: 1024)')
+    parser.add_argument('--max-sequence-length', type=int,
+                        default=DEFAULT_MAX_SEQUENCE_LENGTH,
+                        help='Longest sequence accepted; keep its solve time well under '
+                             f'--timeout (default: {DEFAULT_MAX_SEQUENCE_LENGTH})')
+    parser.add_argument('--timeout', type=float, default=5.0,
+                        help='Default per-request timeout in seconds; only prevents '
+                             'dispatch, running work is not cancelled (default: 5.0)')
+    return parser.parse_args(argv)
+
+
+async def run_server(args):
+    """
+    Menjalankan server sesuai argumen command line
+
+    Returns:
+        Exit code (1 jika socket gagal dibuka)
+    """
+    server = LMISServer(workers=args.workers,
+                        max_batch_size=args.max_batch_size,
+                        max_batch_delay=args.max_batch_delay,
+                        max_batch_cost=args.max_batch_cost,
+                        max_queue=args.max_queue,
+                        default_timeout=args.timeout,
+                        max_sequence_length=args.max_sequence_length)
+    try:
+        try:
+            await server.start(host=args.host, port=args.port, unix_path=args.unix)
+        except OSError as e:
+            print(f"Error: could not start LMIS server: {e}")
+            return 1
+        address = args.unix if args.unix else f"{args.host}:{args.port}"
+        print(f"LMIS server listening on {address} ({server.workers} workers)")
+        await server.serve_forever()
+    finally:
+        await server.close()
+    return 0
+
+
+def main(argv=None):
+    """Fungsi utama untuk menjalankan server"""
+    args = parse_args(argv)
+    try:
+        status = asyncio.run(run_server(args))
+    except KeyboardInterrupt:
+        print("\nLMIS server stopped")
+        status = 0
+    raise SystemExit(status)
+
+
+if __name__ == "__main__":
+    main()
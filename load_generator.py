@@ -0,0 +1,197 @@
+"""
+Load generator untuk lmis_server.py
+Mengirim banyak request secara bersamaan lalu mengukur throughput dan latency
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+
+
+def percentile(ordered, p):
+    """
+    Menghitung percentile dengan metode nearest-rank
+
+    Args:
+        ordered: List nilai yang sudah diurutkan
+        p: Percentile (0-100)
+    """
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+# Batas panjang satu baris response; LMIS dari sequence panjang bisa melebihi 64 KiB
+READ_LIMIT = 2 ** 24
+
+
+async def open_connection(args):
+    """Membuka koneksi ke server (TCP atau Unix socket)"""
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix, limit=READ_LIMIT)
+    return await asyncio.open_connection(args.host, args.port, limit=READ_LIMIT)
+
+
+async def run_client(client_id, args, latencies, errors):
+    """
+    Satu client: membuka koneksi dan mengirim request secara pipelined
+    dengan paling banyak args.pipeline request yang belum dijawab
+
+    Args:
+        client_id: Nomor client
+        args: Argumen command line
+        latencies: List untuk mencatat latency request yang berhasil
+        errors: Dictionary untuk menghitung error per jenis
+    """
+    reader, writer = await open_connection(args)
+    rng = random.Random(args.seed + client_id)
+    sent_at = {}
+    window = asyncio.Semaphore(args.pipeline)
+
+    async def receive():
+        for _ in range(args.requests):
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("server closed the connection")
+            response = json.loads(line)
+            started = sent_at.pop(response.get('id'), None)
+            if 'error' in response or started is None:
+                error = response.get('error', 'unknown id')
+                errors[error] = errors.get(error, 0) + 1
+            else:
+                latencies.append(time.perf_counter() - started)
+            window.release()
+
+    receiver = asyncio.create_task(receive())
+    try:
+        for i in range(args.requests):
+            # Jika receiver berhenti (misalnya koneksi ditutup), jangan menunggu selamanya
+            acquire = asyncio.create_task(window.acquire())
+            done, _ = await asyncio.wait({acquire, receiver},
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if acquire not in done:
+                acquire.cancel()
+                receiver.result()
+                raise ConnectionError("receiver stopped before all requests were sent")
+            request_id = f"{client_id}-{i}"
+            request = {
+                'id': request_id,
+                'sequence': [rng.randint(0, args.max_value) for _ in range(args.length)],
+            }
+            if args.timeout is not None:
+                request['timeout'] = args.timeout
+            sent_at[request_id] = time.perf_counter()
+            writer.write(json.dumps(request).encode() + b'\n')
+            await writer.drain()
+        await receiver
+    finally:
+        receiver.cancel()
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def fetch_server_stats(args):
+    """Mengambil statistik dari server"""
+    reader, writer = await open_connection(args)
+    try:
+        writer.write(json.dumps({'id': 'stats', 'op': 'stats'}).encode() + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())['stats']
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load(args):
+    """Menjalankan seluruh client lalu mencetak ringkasan hasil"""
+    latencies = []
+    errors = {}
+
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(*(run_client(i, args, latencies, errors)
+                                      for i in range(args.clients)),
+                                    return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    total = args.clients * args.requests
+    ordered = sorted(latencies)
+    client_errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    # Request yang tidak pernah mendapat response karena koneksinya gagal
+    unanswered = total - len(latencies) - sum(errors.values())
+    if unanswered > 0:
+        errors['no response'] = unanswered
+
+    print("=" * 70)
+    print("LMIS LOAD TEST")
+    print("=" * 70)
+    print(f"Clients: {args.clients}, Requests/client: {args.requests}, "
+          f"Pipeline: {args.pipeline}, Sequence length: {args.length}")
+    print(f"Total requests: {total}")
+    print(f"Succeeded: {len(latencies)}")
+    print(f"Failed: {sum(errors.values())} {errors if errors else ''}")
+    print(f"Elapsed: {elapsed:.3f} s")
+    print(f"Throughput: {len(latencies) / elapsed:.1f} req/s")
+    for error in client_errors:
+        print(f"Client error: {type(error).__name__}: {error}")
+
+    if ordered:
+        print("\nClient-side latency (ms):")
+        for p in (50, 90, 99):
+            print(f"- p{p}: {percentile(ordered, p) * 1000:.3f}")
+        print(f"- max: {ordered[-1] * 1000:.3f}")
+
+    try:
+        stats = await fetch_server_stats(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"\nServer statistics unavailable: {type(e).__name__}: {e}")
+    else:
+        print("\nServer statistics:")
+        for key, value in stats.items():
+            print(f"- {key}: {value}")
+    print("=" * 70)
+
+
+def positive_int(value):
+    """Tipe argparse untuk bilangan bulat positif"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def parse_args(argv=None):
+    """Parsing argumen command line"""
+    parser = argparse.ArgumentParser(description='Load generator for lmis_server.py')
+    parser.add_argument('--host', default='127.0.0.1', help='TCP host (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port (default: 8765)')
+    parser.add_argument('--unix', metavar='PATH', help='Connect to a Unix socket instead of TCP')
+    parser.add_argument('--clients', type=positive_int, default=8,
+                        help='Concurrent connections (default: 8)')
+    parser.add_argument('--requests', type=positive_int, default=200,
+                        help='Requests per connection (default: 200)')
+    parser.add_argument('--pipeline', type=positive_int, default=4,
+                        help='Outstanding requests per connection (default: 4)')
+    parser.add_argument('--length', type=int, default=200,
+                        help='Length of each random sequence (default: 200)')
+    parser.add_argument('--max-value', type=int, default=1000,
+                        help='Largest value in random sequences (default: 1000)')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='Per-request timeout sent to the server (default: server default)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Fungsi utama untuk menjalankan load test"""
+    asyncio.run(run_load(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Smoke test untuk lmis_server.py
+Menjalankan LMISServer pada port acak lalu mengirim request melalui TCP
+"""
+
+import asyncio
+import json
+import os
+import signal
+import sys
+import types
+import unittest
+
+# lmis.py mengimpor matplotlib dan networkx di level modul, padahal server
+# hanya memakai solve_dp; stub dipasang jika library visualisasi tidak ada
+try:
+    import matplotlib  # noqa: F401
+    import networkx  # noqa: F401
+except ImportError:
+    for name in ('matplotlib', 'matplotlib.pyplot', 'matplotlib.patches', 'networkx'):
+        sys.modules[name] = types.ModuleType(name)
+    sys.modules['matplotlib.patches'].FancyBboxPatch = object
+
+from lmis_server import LMISServer
+
+# Sequence panjang yang membuat satu worker sibuk cukup lama (ratusan milidetik)
+LONG_SEQUENCE = list(range(4000))
+
+
+class LMISServerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def start_server(self, **kwargs):
+        """Menjalankan server pada port yang dipilih otomatis"""
+        kwargs.setdefault('workers', 1)
+        self.server = LMISServer(**kwargs)
+        await self.server.start(host='127.0.0.1', port=0)
+        self.port = self.server.server.sockets[0].getsockname()[1]
+
+    async def send_line(self, line):
+        """Mengirim satu baris mentah dan mengembalikan response-nya"""
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        try:
+            writer.write(line + b'\n')
+            await writer.drain()
+            return json.loads(await reader.readline())
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def request(self, **request):
+        return await self.send_line(json.dumps(request).encode())
+
+    async def wait_for_dispatch(self):
+        """Menunggu sampai ada batch yang berjalan di worker"""
+        while self.server.get_statistics()['inflight_batches'] == 0:
+            await asyncio.sleep(0.01)
+
+    async def test_solve_and_stats(self):
+        await self.start_server()
+
+        response = await self.request(id=1, sequence=[4, 1, 13, 7, 0, 2, 8, 11, 3])
+        self.assertEqual(response, {'id': 1, 'sequence': [4, 7, 8, 11], 'length': 4})
+
+        stats = (await self.request(id=2, op='stats'))['stats']
+        self.assertEqual(stats['completed'], 1)
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertIsNotNone(stats['latency_ms']['p50'])
+
+    async def test_rejects_invalid_requests(self):
+        await self.start_server()
+
+        response = await self.send_line(b'{"id": 1, "sequence": [1e400, 2]}')
+        self.assertEqual(response['error'], "'sequence' must contain finite numbers")
+
+        response = await self.send_line(b'not json')
+        self.assertTrue(response['error'].startswith('bad request'))
+
+    async def test_timeout(self):
+        await self.start_server()
+
+        running = asyncio.create_task(self.request(id=1, sequence=LONG_SEQUENCE))
+        await self.wait_for_dispatch()
+
+        response = await self.request(id=2, sequence=[3, 1, 2], timeout=0.05)
+        self.assertEqual(response, {'id': 2, 'error': 'timeout'})
+        self.assertEqual((await running)['length'], len(LONG_SEQUENCE))
+
+    async def test_overloaded(self):
+        await self.start_server(max_queue=1)
+
+        running = asyncio.create_task(self.request(id=1, sequence=LONG_SEQUENCE))
+        await self.wait_for_dispatch()
+        queued = asyncio.create_task(self.request(id=2, sequence=[3, 1, 2]))
+        while self.server.get_statistics()['queue_depth'] == 0:
+            await asyncio.sleep(0.01)
+
+        response = await self.request(id=3, sequence=[3, 1, 2])
+        self.assertEqual(response, {'id': 3, 'error': 'overloaded'})
+        self.assertEqual((await queued)['length'], 2)
+        await running
+
+    async def test_expired_requests_free_queue_capacity(self):
+        await self.start_server(max_queue=2)
+
+        running = asyncio.create_task(self.request(id=1, sequence=LONG_SEQUENCE))
+        await self.wait_for_dispatch()
+        expired = await asyncio.gather(
+            *(self.request(id=i, sequence=[3, 1, 2], timeout=0.05) for i in (2, 3)))
+        self.assertEqual([r['error'] for r in expired], ['timeout', 'timeout'])
+        self.assertEqual(self.server.get_statistics()['queue_depth'], 0)
+
+        response = await self.request(id=4, sequence=[3, 1, 2])
+        self.assertEqual(response['length'], 2)
+        await running
+
+    async def test_recovers_from_worker_crash(self):
+        await self.start_server()
+        await self.request(id=1, sequence=[1, 2, 3])
+
+        for pid in list(self.server.executor._processes):
+            os.kill(pid, signal.SIGKILL)
+        await asyncio.sleep(0.2)
+
+        # Batch yang sedang berjalan saat worker mati boleh gagal, berikutnya tidak
+        await self.request(id=2, sequence=[1, 2, 3])
+        response = await self.request(id=3, sequence=[4, 1, 13, 7])
+        self.assertEqual(response['length'], 2)
+        self.assertEqual(self.server.get_statistics()['worker_restarts'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()